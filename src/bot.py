@@ -2,9 +2,11 @@ import asyncio
 import discord
 import logging
 from datetime import datetime
+from typing import Optional
 from discord.ext import commands
 
-from config import BOT
+from config import BOT, LLM
+from utils.llm import LLMClient
 from utils.logging_manager import LoggingManager
 
 current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -15,13 +17,32 @@ logger = LoggingManager.setup_logger(
     console_output=True,
     file_output=BOT.LOG.LOG_TO_FILE,
     filename=log_filename,
-    file_mode="w",
+    file_mode="a",
     level=getattr(logging, "INFO", logging.INFO),
 )
 
-intents = discord.Intents.default()
-intents.members = True
-intents.message_content = True
+# Only subscribe to the gateway events the bot handles, so Discord doesn't
+# push typing, reaction, voice and other events that would just be parsed
+# and discarded
+intents = discord.Intents.none()
+intents.guilds = True  # Guild, channel and role cache
+intents.members = True  # on_member_join / on_member_remove and role.members
+intents.guild_messages = True  # Commands and the chatbot in guild channels
+intents.dm_messages = True  # Commands sent in direct messages
+intents.message_content = True  # Reading command and chatbot message text
+
+# Names of the enabled intents; iterating Intents skips alias flags such as
+# `messages` and only reports flags whose bits are all set
+ENABLED_INTENTS = ", ".join(name for name, enabled in intents if enabled)
+
+# Presence messages the bot rotates through
+STATUS_MESSAGES = (
+    f"with {BOT.BOT_PREFIX}help",
+    "in a friendly server",
+    f"Use {BOT.BOT_PREFIX}help for commands!",
+    "with new friends",
+    "and having fun!",
+)
 
 
 class CustomBot(commands.Bot):
@@ -29,24 +50,40 @@ class CustomBot(commands.Bot):
         super().__init__(
             command_prefix=BOT.BOT_PREFIX,
             intents=intents,
+            # Messages are only handled as they arrive, so skip the message cache
+            max_messages=None,
             description="A multi-purpose Discord bot with modular features",
         )
-        self.settings = {}
-        self.status_messages = [
-            f"with {BOT.BOT_PREFIX}help",
-            f"in a friendly server",
-            f"Use {BOT.BOT_PREFIX}help for commands!",
-            "with new friends",
-            "and having fun!",
-        ]
+        self.status_messages = STATUS_MESSAGES
         self.guild_id = int(BOT.GUILD_ID) if BOT.GUILD_ID else None
+        self.rotate_status_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self):
         """Initialize bot extensions and load event listeners."""
-        await self.load_event_handlers()
-        await self.load_commands()
+        # Module loading is independent of the network warm-up, so overlap them
+        await asyncio.gather(
+            self.load_event_handlers(),
+            self.load_commands(),
+            self.prewarm_llm_connections(),
+        )
+        logger.info("Gateway intents enabled: %s", ENABLED_INTENTS)
         logger.info("Bot setup complete.")
 
+    async def prewarm_llm_connections(self):
+        """Open LLM API connections early so the first event skips the handshake."""
+        prewarmed = await LLMClient.prewarm(
+            [
+                LLM.WELCOME.API_URL,
+                LLM.GOODBYE.API_URL,
+                LLM.TRANSLATOR.API_URL,
+                LLM.CHATBOT.API_URL,
+            ]
+        )
+        if prewarmed:
+            logger.info("Prewarmed LLM API connections")
+        else:
+            logger.warning("Could not prewarm some LLM API connections")
+
     async def load_event_handlers(self):
         """Load all event handlers from the events directory."""
         try:
@@ -55,7 +92,7 @@ class CustomBot(commands.Bot):
 
             logger.info("Loaded event handlers successfully")
         except Exception as e:
-            logger.error(f"Failed to load event handlers: {str(e)}")
+            logger.error("Failed to load event handlers: %s", e)
 
     async def load_commands(self):
         """Load all commands from the commands directory."""
@@ -65,44 +102,68 @@ class CustomBot(commands.Bot):
 
             logger.info("Loaded commands successfully")
         except Exception as e:
-            logger.error(f"Failed to load commands: {str(e)}")
+            logger.error("Failed to load commands: %s", e)
 
     async def on_ready(self):
         """Called when the bot is ready and connected."""
-        logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
-        logger.info(f"Connected to {len(self.guilds)} guild(s)")
+        logger.info("Logged in as %s (ID: %s)", self.user, self.user.id)
+        logger.info("Connected to %s guild(s)", len(self.guilds))
 
         if self.guild_id:
             guild = self.get_guild(self.guild_id)
             if guild:
-                logger.info(f"Primary guild: {guild.name} (ID: {guild.id})")
+                logger.info("Primary guild: %s (ID: %s)", guild.name, guild.id)
             else:
-                logger.warning(f"Could not find primary guild with ID: {self.guild_id}")
-
-        await self.change_presence(activity=discord.Game(name=self.status_messages[0]))
+                logger.warning(
+                    "Could not find primary guild with ID: %s", self.guild_id
+                )
 
-        # Start status rotation task
-        self.rotate_status_task = self.loop.create_task(self.rotate_status())
+        # on_ready fires again after every reconnect; keep the running rotation
+        if self.rotate_status_task is None or self.rotate_status_task.done():
+            await self.change_presence(
+                activity=discord.Game(name=self.status_messages[0])
+            )
+            self.rotate_status_task = self.loop.create_task(self.rotate_status())
 
     async def rotate_status(self):
         """Rotate through status messages periodically."""
         status_index = 0
 
         while not self.is_closed():
+            await asyncio.sleep(300)  # Change status every 5 minutes
+
             status_index = (status_index + 1) % len(self.status_messages)
             await self.change_presence(
                 activity=discord.Game(name=self.status_messages[status_index])
             )
-            await asyncio.sleep(300)  # Change status every 5 minutes
 
     async def close(self):
         """Clean up before closing the bot."""
         logger.info("Bot is shutting down...")
 
         # Cancel any ongoing tasks
-        if hasattr(self, "rotate_status_task"):
+        if self.rotate_status_task is not None:
             self.rotate_status_task.cancel()
 
+        # Let a pending chat history save finish so recent messages aren't lost
+        try:
+            from events.chatbot import wait_for_history_save
+
+            await wait_for_history_save()
+        except Exception as e:
+            logger.error("Failed to save chat histories on shutdown: %s", e)
+
+        # Same for translations cached since the last cache file write
+        try:
+            from utils.translate_cache import translation_cache
+
+            await translation_cache.flush()
+        except Exception as e:
+            logger.error("Failed to save translation cache on shutdown: %s", e)
+
+        # Release pooled LLM connections
+        await LLMClient.close_http_client()
+
         await super().close()
 
 
@@ -1,5 +1,6 @@
 from .nickname import *
 from .language import *
+from .cachestats import *
 
 # Flag to indicate all commands are loaded
 all_commands = True
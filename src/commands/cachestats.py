@@ -0,0 +1,52 @@
+import discord
+from discord.ext import commands
+
+from bot import bot, logger
+from utils.command_utils import lookup_error_message
+from utils.translate_cache import translation_cache
+
+
+@bot.command(name="cachestats")
+@commands.has_permissions(manage_guild=True)
+async def cachestats(ctx):
+    """
+    Show hit/miss statistics for the name translation cache.
+
+    Usage:
+        !cachestats
+    """
+    hits = translation_cache.stats["hits"]
+    misses = translation_cache.stats["misses"]
+    lookups = hits + misses
+    hit_rate = (hits / lookups * 100) if lookups else 0.0
+
+    embed = discord.Embed(
+        title="Translation Cache Statistics",
+        description=f"Cached translations: **{len(translation_cache)}**",
+        color=0x5CDBF0,  # Light blue
+    )
+
+    embed.add_field(name="Hits", value=str(hits), inline=True)
+    embed.add_field(name="Misses", value=str(misses), inline=True)
+    embed.add_field(name="Hit Rate", value=f"{hit_rate:.1f}%", inline=True)
+
+    await ctx.send(embed=embed)
+
+
+# User-facing messages for expected cachestats command errors
+CACHESTATS_ERROR_MESSAGES = {
+    commands.MissingPermissions: (
+        "You need the 'Manage Server' permission to view cache statistics."
+    ),
+}
+
+
+@cachestats.error
+async def cachestats_error(ctx, error):
+    """Error handler for the cachestats command."""
+    message = lookup_error_message(CACHESTATS_ERROR_MESSAGES, error)
+    if message:
+        await ctx.send(message)
+    else:
+        await ctx.send(f"An error occurred: {str(error)}")
+        logger.error("Error in cachestats command: %s", error)
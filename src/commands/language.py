@@ -3,6 +3,7 @@ from discord.ext import commands
 
 from bot import bot, logger
 from utils.translator import Translator
+from utils.command_utils import lookup_error_message
 
 
 @bot.command(name="language")
@@ -47,7 +48,9 @@ async def language(ctx, new_language: str = None):
         )
 
         await ctx.send(embed=embed)
-        logger.info(f"Default language changed to {new_language} by {ctx.author.name}")
+        logger.info(
+            "Default language changed to %s by %s", new_language, ctx.author.name
+        )
     else:
         # Show the current language
         current_language = await Translator.get_translation_language()
@@ -77,13 +80,20 @@ async def language(ctx, new_language: str = None):
         await ctx.send(embed=embed)
 
 
+# User-facing messages for expected language command errors
+LANGUAGE_ERROR_MESSAGES = {
+    commands.MissingPermissions: (
+        "You need the 'Manage Server' permission to change the default language."
+    ),
+}
+
+
 @language.error
 async def language_error(ctx, error):
     """Error handler for the language command."""
-    if isinstance(error, commands.MissingPermissions):
-        await ctx.send(
-            "You need the 'Manage Server' permission to change the default language."
-        )
+    message = lookup_error_message(LANGUAGE_ERROR_MESSAGES, error)
+    if message:
+        await ctx.send(message)
     else:
         await ctx.send(f"An error occurred: {str(error)}")
-        logger.error(f"Error in language command: {str(error)}")
+        logger.error("Error in language command: %s", error)
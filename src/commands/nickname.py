@@ -1,14 +1,80 @@
+import re
+import copy
 import asyncio
 import discord
+from enum import IntEnum
 from discord.ext import commands
 from typing import Optional, Tuple
 
 from bot import bot, logger
+from config import BOT
+from utils.command_utils import describe_permissions, lookup_error_message
+from utils.rate_limiter import AsyncTokenBucket
+from utils.tasks import spawn_background
 from utils.translator import Translator
+from utils.translate_cache import translation_cache
+
+
+class NicknameStatus(IntEnum):
+    """Outcome of a single nickname change."""
+
+    SUCCESS = 0
+    SKIPPED = 1
+    FAILED = 2
+
+
+# Paces nickname edits shared across all running nickname commands
+nickname_edit_limiter = AsyncTokenBucket(
+    rate=BOT.NICKNAME.EDITS_PER_SECOND, capacity=BOT.NICKNAME.EDIT_BURST
+)
+
+# Command argument patterns, e.g. `language=Spanish` and `"Role Name"`
+LANGUAGE_ARG_PATTERN = re.compile(r"(?:^|\s)language=(\S+)")
+QUOTED_TEXT_PATTERN = re.compile(r'"([^"]*)"')
+
+# Static part of the nickname help embed, built once
+NICKNAME_HELP_EMBED = {
+    "title": "Nickname Command Help",
+    "description": "Translate user display names to various languages",
+    "color": 0x5CDBF0,
+    "fields": [
+        {
+            "name": "User Mode",
+            "value": "Change nicknames for mentioned users\n`!nickname user @user1 @user2 [language=Language]`",
+            "inline": False,
+        },
+        {
+            "name": "Role Mode",
+            "value": 'Change nicknames for all users with a specific role\n`!nickname role "Role Name" [language=Language]`',
+            "inline": False,
+        },
+        {
+            "name": "All Mode",
+            "value": "Change nicknames for all server members\n`!nickname all [language=Language]`",
+            "inline": False,
+        },
+        {
+            "name": "Reset Mode",
+            "value": "Remove nicknames for mentioned users\n`!nickname reset @user1 @user2`",
+            "inline": False,
+        },
+        {
+            "name": "Reset Role Mode",
+            "value": 'Remove nicknames for all users with a specific role\n`!nickname reset-role "Role Name"`',
+            "inline": False,
+        },
+        {
+            "name": "Reset All Mode",
+            "value": "Remove nicknames for all server members\n`!nickname reset-all`",
+            "inline": False,
+        },
+    ],
+}
 
 
 @bot.command(name="nickname")
 @commands.has_permissions(manage_nicknames=True)
+@commands.bot_has_permissions(manage_nicknames=True)
 async def nickname(ctx, mode: str = None, *, args: str = None):
     """
     Change display names of users to translated names.
@@ -29,48 +95,9 @@ async def nickname(ctx, mode: str = None, *, args: str = None):
     """
     if not mode:
         # Show help if no mode provided
-        help_embed = discord.Embed(
-            title="Nickname Command Help",
-            description="Translate user display names to various languages",
-            color=0x5CDBF0,
-        )
-
-        help_embed.add_field(
-            name="User Mode",
-            value="Change nicknames for mentioned users\n`!nickname user @user1 @user2 [language=Language]`",
-            inline=False,
-        )
-
-        help_embed.add_field(
-            name="Role Mode",
-            value='Change nicknames for all users with a specific role\n`!nickname role "Role Name" [language=Language]`',
-            inline=False,
-        )
-
-        help_embed.add_field(
-            name="All Mode",
-            value="Change nicknames for all server members\n`!nickname all [language=Language]`",
-            inline=False,
-        )
-
-        help_embed.add_field(
-            name="Reset Mode",
-            value="Remove nicknames for mentioned users\n`!nickname reset @user1 @user2`",
-            inline=False,
-        )
-
-        help_embed.add_field(
-            name="Reset Role Mode",
-            value='Remove nicknames for all users with a specific role\n`!nickname reset-role "Role Name"`',
-            inline=False,
-        )
-
-        help_embed.add_field(
-            name="Reset All Mode",
-            value="Remove nicknames for all server members\n`!nickname reset-all`",
-            inline=False,
-        )
-
+        # from_dict keeps references to the template's nested lists and dicts,
+        # so hand it a copy to keep the module-level template unchanged
+        help_embed = discord.Embed.from_dict(copy.deepcopy(NICKNAME_HELP_EMBED))
         help_embed.set_footer(
             text="Default language: " + await Translator.get_translation_language()
         )
@@ -131,11 +158,40 @@ async def process_user_mode(ctx, args):
         await ctx.send("Please mention at least one user to change their nickname.")
         return
 
-    # Process the mentioned users
-    results = []
-    for user in mentioned_users:
-        result = await translate_user_nickname(ctx, user, language)
-        results.append(result)
+    # Only translate the names of users that won't be skipped, like
+    # process_members_in_chunks does
+    bot_top_role = ctx.guild.me.top_role
+    eligible_users = [
+        user
+        for user in mentioned_users
+        if can_modify_member(ctx, user, bot_top_role)
+        and not Translator.is_non_latin(user.display_name)
+        and not is_already_translated(user, language)
+    ]
+
+    # Translate the eligible names in one request, then apply the nicknames
+    # concurrently; the shared edit limiter keeps Discord requests paced.
+    # Skipped users get no translation and report their skip reason
+    translated_names = dict(
+        zip(
+            eligible_users,
+            await Translator.translate_names(
+                [user.display_name for user in eligible_users], language
+            ),
+        )
+    )
+    results = await asyncio.gather(
+        *(
+            translate_user_nickname(
+                ctx,
+                user,
+                language,
+                bot_top_role,
+                translated_name=translated_names.get(user),
+            )
+            for user in mentioned_users
+        )
+    )
 
     # Create and send results embed
     await send_results_embed(ctx, results, f"User Mode ({language})")
@@ -226,11 +282,11 @@ async def process_reset_mode(ctx, args):
         await ctx.send("Please mention at least one user to reset their nickname.")
         return
 
-    # Process the mentioned users
-    results = []
-    for user in mentioned_users:
-        result = await reset_user_nickname(ctx, user)
-        results.append(result)
+    # Reset the mentioned users concurrently; edits are paced by the limiter
+    bot_top_role = ctx.guild.me.top_role
+    results = await asyncio.gather(
+        *(reset_user_nickname(ctx, user, bot_top_role) for user in mentioned_users)
+    )
 
     # Create and send results embed
     await send_results_embed(ctx, results, "Reset Nicknames")
@@ -297,82 +353,159 @@ async def process_reset_all_mode(ctx):
 async def process_members_in_chunks(
     ctx, members, language, description, initial_message, is_reset=False
 ):
-    """Process a large number of members in chunks to avoid rate limits."""
+    """Process a large number of members concurrently with bounded concurrency."""
+    # Resolve the bot's hierarchy position and the owner check once for all
+    # members; the Manage Nicknames permission is already enforced by the
+    # command's checks
+    guild = ctx.guild
+    bot_top_role = guild.me.top_role
+    bot_position = bot_top_role.position
+    author_is_owner = guild.owner_id == ctx.author.id
+
+    # Drop members that would only be skipped before scheduling any work
+    # (the same rule as can_modify_member, with the per-member lookups hoisted)
+    eligible_members = [
+        member
+        for member in members
+        if (author_is_owner or bot_position > member.top_role.position)
+        and (
+            member.nick is not None
+            if is_reset
+            else not Translator.is_non_latin(member.display_name)
+            and not is_already_translated(member, language)
+        )
+    ]
+
     # Create progress embed
     operation_type = "Reset" if is_reset else f"Translation ({language})"
     embed = discord.Embed(
         title=f"Nickname {operation_type}",
-        description=f"Processing {len(members)} {description}...",
+        description=f"Processing {len(eligible_members)} {description}...",
         color=0x5CDBF0,
     )
     embed.add_field(name="Status", value="Starting...", inline=False)
     status_message = await ctx.send(embed=embed)
 
-    # Process members in chunks
-    chunk_size = 5
-    total_members = len(members)
+    # The progress embed supersedes the initial message; delete it in the
+    # background rather than holding the command until everything finishes
+    spawn_background(delete_message_quietly(initial_message))
+
+    # Translation (LLM) and nickname edits (Discord) run in separate worker
+    # pools connected by a queue, so each side runs at its own concurrency
+    translation_workers = 3
+    edit_workers = 5
+    batch_size = 10
+    edit_queue = asyncio.Queue(maxsize=2 * edit_workers)
+    total_members = len(eligible_members)
     results = []
-    successful = 0
-    skipped = 0
-    failed = 0
-
-    for i in range(0, total_members, chunk_size):
-        chunk = members[i : i + chunk_size]
-        chunk_results = []
+    # Outcome counts indexed by NicknameStatus; pre-filtered members are skipped
+    status_counts = [0] * len(NicknameStatus)
+    status_counts[NicknameStatus.SKIPPED] = len(members) - total_members
+
+    batches = iter(
+        [
+            eligible_members[i : i + batch_size]
+            for i in range(0, total_members, batch_size)
+        ]
+    )
 
-        for member in chunk:
+    async def translate_worker():
+        for batch in batches:
             if is_reset:
-                result = await reset_user_nickname(ctx, member)
+                translated_names = [None] * len(batch)
             else:
-                result = await translate_user_nickname(ctx, member, language)
-
-            chunk_results.append(result)
-
-            # Update counters
-            if "Changed" in result[0] or "Reset" in result[0]:
-                successful += 1
-            elif "Cannot modify" in result[0] or "No" in result[0]:
-                skipped += 1
-            else:
-                failed += 1
-
-        results.extend(chunk_results)
-
-        # Update progress
-        progress = min(100, int((i + len(chunk)) / total_members * 100))
-
-        embed = discord.Embed(
-            title=f"Nickname {operation_type}",
-            description=f"Processing {total_members} {description}...",
-            color=0x5CDBF0,
-        )
-        embed.add_field(
-            name="Progress",
-            value=f"{progress}% complete ({i + len(chunk)}/{total_members})",
-            inline=False,
-        )
-        embed.add_field(
-            name="Status",
-            value=f"✅ Success: {successful}\n⏭️ Skipped: {skipped}\n❌ Failed: {failed}",
-            inline=False,
-        )
-
-        await status_message.edit(embed=embed)
+                # Translate the whole batch in one LLM request; names that fail
+                # come back unchanged and are skipped by the edit workers
+                translated_names = await Translator.translate_names(
+                    [member.display_name for member in batch], language
+                )
+
+            for member, translated_name in zip(batch, translated_names):
+                await edit_queue.put((member, translated_name))
+
+    async def edit_worker():
+        while True:
+            member, translated_name = await edit_queue.get()
+            try:
+                if is_reset:
+                    result = await reset_user_nickname(ctx, member, bot_top_role)
+                else:
+                    result = await apply_translated_nickname(member, translated_name)
+            except Exception as e:
+                # Never let one member take down the worker and stall the queue
+                logger.error(
+                    "Failed to process nickname for %s: %s", member.display_name, e
+                )
+                result = (
+                    f"• Error processing {member.display_name}'s nickname: {str(e)}",
+                    NicknameStatus.FAILED,
+                )
+
+            # Update counters (no awaits here, so no lock is needed)
+            results.append(result)
+            status_counts[result[1]] += 1
+            edit_queue.task_done()
+
+    async def report_progress():
+        # Refresh the progress embed periodically instead of once per member,
+        # so workers never wait on a Discord edit
+        last_completed = 0
+        while True:
+            await asyncio.sleep(2)
+
+            completed = len(results)
+            if completed == last_completed:
+                continue
+            last_completed = completed
+
+            progress = min(100, int(completed / total_members * 100))
+
+            embed = discord.Embed(
+                title=f"Nickname {operation_type}",
+                description=f"Processing {total_members} {description}...",
+                color=0x5CDBF0,
+            )
+            embed.add_field(
+                name="Progress",
+                value=f"{progress}% complete ({completed}/{total_members})",
+                inline=False,
+            )
+            embed.add_field(
+                name="Status",
+                value=format_status_counts(status_counts),
+                inline=False,
+            )
+
+            try:
+                await status_message.edit(embed=embed)
+            except discord.HTTPException as e:
+                logger.warning("Failed to update nickname progress: %s", e)
+
+    progress_task = asyncio.create_task(report_progress())
+    edit_tasks = [asyncio.create_task(edit_worker()) for _ in range(edit_workers)]
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(translation_workers):
+                task_group.create_task(translate_worker())
 
-        # Short delay to avoid rate limits
-        await asyncio.sleep(1)
+        # Wait for the edit workers to drain the queue
+        await edit_queue.join()
+    finally:
+        progress_task.cancel()
+        for task in edit_tasks:
+            task.cancel()
 
     # Create final results embed
     final_embed = discord.Embed(
         title=f"Nickname {operation_type} Complete",
-        description=f"Processed {total_members} {description}"
+        description=f"Processed {len(members)} {description}"
         + (f" with language: {language}" if not is_reset else ""),
         color=0x00FF00,
     )
 
     final_embed.add_field(
         name="Results Summary",
-        value=f"✅ Success: {successful}\n⏭️ Skipped: {skipped}\n❌ Failed: {failed}",
+        value=format_status_counts(status_counts),
         inline=False,
     )
 
@@ -394,12 +527,78 @@ async def process_members_in_chunks(
     )
 
     await status_message.edit(embed=final_embed)
-    await initial_message.delete()
+
+
+async def delete_message_quietly(message: discord.Message) -> None:
+    """Delete a message, ignoring failures such as it already being gone."""
+    try:
+        await message.delete()
+    except discord.HTTPException as e:
+        logger.debug("Failed to delete message %s: %s", message.id, e)
+
+
+def can_modify_member(ctx, member: discord.Member, bot_top_role: discord.Role) -> bool:
+    """
+    Check whether the role hierarchy allows changing a member's nickname.
+
+    Args:
+        ctx: Command context
+        member: Member whose nickname would change
+        bot_top_role: The bot's top role
+
+    Returns:
+        True if the command author is the owner or the bot outranks the member
+    """
+    # The owner check needs no role lookup, so it runs first; positions are
+    # compared directly instead of going through Role's rich comparisons
+    if ctx.guild.owner_id == ctx.author.id:
+        return True
+
+    return bot_top_role.position > member.top_role.position
+
+
+def format_status_counts(status_counts) -> str:
+    """
+    Format nickname outcome counts for an embed field.
+
+    Args:
+        status_counts: Outcome counts indexed by NicknameStatus
+
+    Returns:
+        Formatted summary of successes, skips and failures
+    """
+    return (
+        f"✅ Success: {status_counts[NicknameStatus.SUCCESS]}\n"
+        f"⏭️ Skipped: {status_counts[NicknameStatus.SKIPPED]}\n"
+        f"❌ Failed: {status_counts[NicknameStatus.FAILED]}"
+    )
+
+
+def is_already_translated(user: discord.Member, language: str) -> bool:
+    """
+    Check whether a user's nickname is already the cached translation of their name.
+
+    Args:
+        user: User to check
+        language: Target language for translation
+
+    Returns:
+        True if the nickname matches the cached translation
+    """
+    if user.nick is None:
+        return False
+
+    base_name = user.global_name or user.name
+    return translation_cache.peek(base_name, language) == user.nick
 
 
 async def translate_user_nickname(
-    ctx, user: discord.Member, language: str
-) -> Tuple[str, str]:
+    ctx,
+    user: discord.Member,
+    language: str,
+    bot_top_role: Optional[discord.Role] = None,
+    translated_name: Optional[str] = None,
+) -> Tuple[str, NicknameStatus]:
     """
     Translate a user's display name to the specified language.
 
@@ -407,81 +606,143 @@ async def translate_user_nickname(
         ctx: Command context
         user: User to translate display name for
         language: Target language for translation
+        bot_top_role: The bot's top role (optional, looked up if None)
+        translated_name: Already translated display name (optional, translated
+            here if None)
 
     Returns:
         Tuple containing (result_message, status)
     """
+    if bot_top_role is None:
+        bot_top_role = ctx.guild.me.top_role
+
     # Skip if we can't modify the user due to role hierarchy
-    if (
-        not ctx.guild.me.top_role > user.top_role
-        and ctx.guild.owner_id != ctx.author.id
-    ):
-        return (f"• Cannot modify {user.display_name} (higher role)", "skipped")
+    if not can_modify_member(ctx, user, bot_top_role):
+        return (
+            f"• Cannot modify {user.display_name} (higher role)",
+            NicknameStatus.SKIPPED,
+        )
 
     # Get user's current display name or username if no nickname is set
     current_name = user.display_name
 
-    # Translate the display name
-    translated_name = await Translator.translate_name(current_name, language)
+    # Skip the LLM round-trip if the name is already in non-latin characters
+    if Translator.is_non_latin(current_name):
+        return (f"• No translation needed for {current_name}", NicknameStatus.SKIPPED)
+
+    # Skip if an earlier run already set the nickname to this translation
+    if is_already_translated(user, language):
+        return (f"• {current_name} is already translated", NicknameStatus.SKIPPED)
+
+    # Translate the display name unless the caller already did
+    if translated_name is None:
+        translated_name = await Translator.translate_name(current_name, language)
+
+    return await apply_translated_nickname(user, translated_name)
+
+
+async def apply_translated_nickname(
+    user: discord.Member, translated_name: str
+) -> Tuple[str, NicknameStatus]:
+    """
+    Set a user's nickname to an already translated name.
+
+    Args:
+        user: User to change the nickname for
+        translated_name: The translated display name
+
+    Returns:
+        Tuple containing (result_message, status)
+    """
+    current_name = user.display_name
 
     # Skip if no change needed
     if translated_name == current_name:
-        return (f"• No translation needed for {current_name}", "skipped")
+        return (f"• No translation needed for {current_name}", NicknameStatus.SKIPPED)
 
     # Try to set the nickname
+    error = await edit_nickname(user, translated_name, "change")
+    if error:
+        return error
+
+    logger.info(
+        "Changed nickname for %s from %s to %s",
+        user.name,
+        current_name,
+        translated_name,
+    )
+    return (f"• Changed {current_name} → {translated_name}", NicknameStatus.SUCCESS)
+
+
+async def edit_nickname(
+    user: discord.Member, nick: Optional[str], action: str
+) -> Optional[Tuple[str, NicknameStatus]]:
+    """
+    Apply a nickname edit, paced by the shared edit limiter.
+
+    Args:
+        user: User to change the nickname for
+        nick: The new nickname, or None to reset it
+        action: Verb describing the edit for messages, e.g. "change" or "reset"
+
+    Returns:
+        None on success, otherwise a (result_message, FAILED) tuple
+    """
     try:
-        await user.edit(nick=translated_name)
-        logger.info(
-            f"Changed nickname for {user.name} from {current_name} to {translated_name}"
-        )
-        return (f"• Changed {current_name} → {translated_name}", "success")
+        await nickname_edit_limiter.acquire()
+        await user.edit(nick=nick)
+        return None
     except discord.Forbidden:
-        return (f"• Missing permissions to change {current_name}'s nickname", "failed")
+        return (
+            f"• Missing permissions to {action} {user.display_name}'s nickname",
+            NicknameStatus.FAILED,
+        )
     except Exception as e:
-        logger.error(f"Failed to set nickname for {current_name}: {str(e)}")
-        return (f"• Error changing {current_name}'s nickname: {str(e)}", "failed")
+        logger.error("Failed to %s nickname for %s: %s", action, user.display_name, e)
+        return (
+            f"• Failed to {action} {user.display_name}'s nickname: {str(e)}",
+            NicknameStatus.FAILED,
+        )
 
 
-async def reset_user_nickname(ctx, user: discord.Member) -> Tuple[str, str]:
+async def reset_user_nickname(
+    ctx, user: discord.Member, bot_top_role: Optional[discord.Role] = None
+) -> Tuple[str, NicknameStatus]:
     """
     Reset a user's nickname to their default username.
 
     Args:
         ctx: Command context
         user: User to reset nickname for
+        bot_top_role: The bot's top role (optional, looked up if None)
 
     Returns:
         Tuple containing (result_message, status)
     """
+    if bot_top_role is None:
+        bot_top_role = ctx.guild.me.top_role
+
     # Skip if we can't modify the user due to role hierarchy
-    if (
-        not ctx.guild.me.top_role > user.top_role
-        and ctx.guild.owner_id != ctx.author.id
-    ):
-        return (f"• Cannot modify {user.display_name} (higher role)", "skipped")
+    if not can_modify_member(ctx, user, bot_top_role):
+        return (
+            f"• Cannot modify {user.display_name} (higher role)",
+            NicknameStatus.SKIPPED,
+        )
 
     # Check if user already has their default name
     if user.nick is None:
-        return (f"• No nickname to reset for {user.name}", "skipped")
+        return (f"• No nickname to reset for {user.name}", NicknameStatus.SKIPPED)
 
     # Store current nickname for logging
     current_nickname = user.nick
 
     # Try to reset the nickname
-    try:
-        await user.edit(nick=None)
-        logger.info(
-            f"Reset nickname for {user.name} from {current_nickname} to default"
-        )
-        return (f"• Reset {current_nickname} → {user.name}", "success")
-    except discord.Forbidden:
-        return (
-            f"• Missing permissions to reset {user.display_name}'s nickname",
-            "failed",
-        )
-    except Exception as e:
-        logger.error(f"Failed to reset nickname for {user.display_name}: {str(e)}")
-        return (f"• Error resetting {user.display_name}'s nickname: {str(e)}", "failed")
+    error = await edit_nickname(user, None, "reset")
+    if error:
+        return error
+
+    logger.info("Reset nickname for %s from %s to default", user.name, current_nickname)
+    return (f"• Reset {current_nickname} → {user.name}", NicknameStatus.SUCCESS)
 
 
 async def send_results_embed(ctx, results, title):
@@ -511,15 +772,10 @@ async def extract_language(args: str) -> str:
     Returns:
         Language string or default language
     """
-    if not args:
-        return await Translator.get_translation_language()
-
     # Check for language parameter
-    if "language=" in args:
-        parts = args.split()
-        for part in parts:
-            if part.startswith("language="):
-                return part.split("=")[1].strip()
+    match = LANGUAGE_ARG_PATTERN.search(args or "")
+    if match:
+        return match.group(1)
 
     # Return default language if not specified
     return await Translator.get_translation_language()
@@ -535,23 +791,28 @@ def extract_quoted_text(text: str) -> Optional[str]:
     Returns:
         Quoted text or None if no quotes found
     """
-    if '"' in text:
-        start = text.find('"')
-        end = text.find('"', start + 1)
-        if start != -1 and end != -1:
-            return text[start + 1 : end]
-    return None
+    match = QUOTED_TEXT_PATTERN.search(text)
+    return match.group(1) if match else None
+
+
+# User-facing messages for expected nickname command errors
+NICKNAME_ERROR_MESSAGES = {
+    commands.MissingPermissions: (
+        "You need the 'Manage Nicknames' permission to use this command."
+    ),
+    commands.BotMissingPermissions: lambda error: (
+        "I don't have the necessary permissions to change nicknames: "
+        f"{describe_permissions(error.missing_permissions)}"
+    ),
+}
 
 
 @nickname.error
 async def nickname_error(ctx, error):
     """Error handler for the nickname command."""
-    if isinstance(error, commands.MissingPermissions):
-        await ctx.send(
-            "You need the 'Manage Nicknames' permission to use this command."
-        )
-    elif isinstance(error, commands.BotMissingPermissions):
-        await ctx.send("I don't have the necessary permissions to change nicknames.")
+    message = lookup_error_message(NICKNAME_ERROR_MESSAGES, error)
+    if message:
+        await ctx.send(message)
     else:
         await ctx.send(f"An error occurred: {str(error)}")
-        logger.error(f"Error in nickname command: {str(error)}")
+        logger.error("Error in nickname command: %s", error)
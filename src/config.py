@@ -18,6 +18,10 @@ class BOT:
     class GOODBYE:
         GOODBYE_CHANNEL_ID = "1367170655132586054"
 
+    class NICKNAME:
+        EDITS_PER_SECOND = 1.0
+        EDIT_BURST = 5
+
 
 class LLM:
     class WELCOME:
@@ -35,6 +39,13 @@ class LLM:
         API_KEY = os.getenv("LLM_API_KEY_3")
         API_URL = os.getenv("LLM_API_URL_3", "https://api.groq.com/openai/v1")
         MODEL = os.getenv("LLM_MODEL_3", "llama-3.3-70b-versatile")
+        CACHE_FILE = "data/translation_cache.json"
+        CACHE_MAX_ENTRIES = 10000
+        CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+        CACHE_FAILURE_TTL = 10 * 60  # 10 minutes
+        CACHE_SAVE_DELAY = 1.0  # seconds
+        REQUESTS_PER_SECOND = 0.5
+        REQUEST_BURST = 5
 
     class CHATBOT:
         API_KEY = os.getenv("LLM_API_KEY_4")
@@ -46,3 +57,4 @@ class LLM:
             CHANNEL_ID = "1367584360198570064"
             CHATBOT_MAX_HISTORY = 10
             CHATBOT_HISTORY_FILE = "data/chatbot_history.json"
+            MAX_CONCURRENT_REQUESTS = 8
@@ -1,20 +1,80 @@
 import os
+import re
+import asyncio
 import json
+import time
+import hashlib
 import discord
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional
 
 from bot import bot, logger
-from config import LLM
+from config import BOT, LLM
 from utils.llm import LLMClient, LLMMessage
+from utils.tasks import DebouncedSave
 
 
 # Constants
 HISTORY_DIR = os.path.dirname(LLM.CHATBOT.BOT_CONFIG.CHATBOT_HISTORY_FILE)
 os.makedirs(HISTORY_DIR, exist_ok=True)
 
-# Chat histories by channel ID
-chat_histories: Dict[str, List[Dict[str, str]]] = {}
+# Channel the chatbot responds in, parsed once so each message is an int compare
+CHATBOT_CHANNEL_ID = (
+    int(LLM.CHATBOT.BOT_CONFIG.CHANNEL_ID)
+    if LLM.CHATBOT.BOT_CONFIG.CHANNEL_ID
+    else None
+)
+
+# Each exchange adds a user and an assistant entry to the history
+MAX_HISTORY_ENTRIES = int(LLM.CHATBOT.BOT_CONFIG.CHATBOT_MAX_HISTORY) * 2
+
+# Chat histories by channel ID; bounded deques drop the oldest entries in O(1)
+chat_histories: Dict[str, Deque[Dict[str, str]]] = {}
+
+# Seconds to wait before writing histories, so a burst of messages is saved once
+HISTORY_SAVE_DELAY = 0.5
+
+# System prompt setting the chatbot's tone and behavior; it contains nothing
+# that changes between messages, so it forms a stable prompt prefix
+SYSTEM_PROMPT = LLMMessage(
+    role="system",
+    content=f"""You are {LLM.CHATBOT.BOT_CONFIG.BOT_NAME}, a friendly and helpful Discord bot.
+You are chatting in a Discord server with multiple users.
+
+IMPORTANT GUIDELINES:
+- Keep your responses concise and friendly
+- Be conversational but brief (1-3 sentences unless a longer explanation is needed)
+- Keep your conversation in English unless requested otherwise
+- Make sure responses are formatted as per Discord's markdown rules
+- Keep responses under 1,800 characters to avoid Discord message length limitations
+- Use discord features like **bold**, *italic*, `code`, ```code blocks``` appropriately
+
+Track users by their unique user ID, not just their display name,
+as users may change their display names but will keep the same user ID.
+""",
+)
+
+# Details about the author of the message being answered
+USER_CONTEXT_TEMPLATE = """USER INFORMATION (author of the latest message):
+- User ID: {user_id}
+- Username: {user_name}#{user_discriminator}
+- Top Role: {user_top_role}
+- Roles: {roles_info}
+"""
+
+# Punctuation and runs of whitespace ignored when matching repeated messages
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Role names by member ID, dropped whenever the member's roles change
+user_roles_cache: Dict[int, List[str]] = {}
+
+# Requests in flight by request key, shared with concurrent repeats
+response_inflight: Dict[str, asyncio.Future] = {}
+
+# Caps chatbot requests in flight, so a burst of messages queues here instead
+# of piling up concurrent requests and retries against the LLM API
+llm_semaphore = asyncio.Semaphore(LLM.CHATBOT.BOT_CONFIG.MAX_CONCURRENT_REQUESTS)
 
 # Load existing chat histories
 try:
@@ -22,22 +82,64 @@ try:
         with open(
             LLM.CHATBOT.BOT_CONFIG.CHATBOT_HISTORY_FILE, "r", encoding="utf-8"
         ) as f:
-            chat_histories = json.load(f)
-            logger.info(f"Loaded chat histories for {len(chat_histories)} channels")
+            chat_histories = {
+                channel_id: deque(history, maxlen=MAX_HISTORY_ENTRIES)
+                for channel_id, history in json.load(f).items()
+            }
+            logger.info("Loaded chat histories for %s channels", len(chat_histories))
 except Exception as e:
-    logger.error(f"Failed to load chat histories: {str(e)}")
+    logger.error("Failed to load chat histories: %s", e)
     chat_histories = {}
 
 
+def get_channel_history(channel_id: str) -> Deque[Dict[str, str]]:
+    """
+    Get a channel's chat history, creating an empty one on first use.
+
+    Args:
+        channel_id: Channel the history belongs to
+
+    Returns:
+        The channel's bounded history deque
+    """
+    history = chat_histories.get(channel_id)
+    if history is None:
+        history = chat_histories[channel_id] = deque(maxlen=MAX_HISTORY_ENTRIES)
+    return history
+
+
 async def save_chat_histories():
     """Save chat histories to file."""
+    # Snapshot on the event loop so the histories can't change mid-write
+    snapshot = {
+        channel_id: list(history) for channel_id, history in chat_histories.items()
+    }
+
     try:
-        with open(
-            LLM.CHATBOT.BOT_CONFIG.CHATBOT_HISTORY_FILE, "w", encoding="utf-8"
-        ) as f:
-            json.dump(chat_histories, f, ensure_ascii=False, indent=2)
+        # Serializing and writing the file blocks, so it runs in a worker thread
+        await asyncio.to_thread(write_chat_histories, snapshot)
     except Exception as e:
-        logger.error(f"Failed to save chat histories: {str(e)}")
+        logger.error("Failed to save chat histories: %s", e)
+
+
+def write_chat_histories(snapshot: Dict[str, List[Dict[str, str]]]):
+    """
+    Write a snapshot of the chat histories to file.
+
+    Args:
+        snapshot: Chat histories by channel ID, as lists
+    """
+    with open(LLM.CHATBOT.BOT_CONFIG.CHATBOT_HISTORY_FILE, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+
+
+# Background history writes; messages added during a write trigger another one
+history_saver = DebouncedSave(save_chat_histories, HISTORY_SAVE_DELAY)
+
+
+async def wait_for_history_save():
+    """Wait for pending history saves to finish, e.g. before shutting down."""
+    await history_saver.flush()
 
 
 @bot.event
@@ -51,17 +153,18 @@ async def on_message(message: discord.Message):
     if bot.guild_id and message.guild and message.guild.id != bot.guild_id:
         return
 
-    # Process commands first
-    await bot.process_commands(message)
+    # Process commands first; the prefix is a plain string, so ordinary chat
+    # can skip building a command context entirely
+    if message.content.startswith(BOT.BOT_PREFIX):
+        await bot.process_commands(message)
 
     # Only respond in the designated channel
-    if str(message.channel.id) != LLM.CHATBOT.BOT_CONFIG.CHANNEL_ID:
+    if message.channel.id != CHATBOT_CHANNEL_ID:
         return
 
     # Get or initialize channel history
     channel_id = str(message.channel.id)
-    if channel_id not in chat_histories:
-        chat_histories[channel_id] = []
+    history = get_channel_history(channel_id)
 
     # Get user details
     user_id = str(message.author.id)
@@ -71,7 +174,7 @@ async def on_message(message: discord.Message):
         if hasattr(message.author, "discriminator")
         else "0000"
     )
-    user_roles = [role.name for role in message.author.roles] if message.guild else []
+    user_roles = get_user_roles(message.author) if message.guild else []
     user_top_role = (
         message.author.top_role.name
         if message.guild and message.author.top_role
@@ -79,31 +182,35 @@ async def on_message(message: discord.Message):
     )
 
     # Add user message to history with user ID
-    chat_histories[channel_id].append(
+    history.append(
         {
             "role": "user",
             "user_id": user_id,
             "name": user_name,
             "content": message.content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": int(time.time()),
         }
     )
 
-    # Trim history if it exceeds the maximum length
-    max_history = int(LLM.CHATBOT.BOT_CONFIG.CHATBOT_MAX_HISTORY)
-    if len(chat_histories[channel_id]) > max_history * 2:
-        chat_histories[channel_id] = chat_histories[channel_id][-max_history * 2 :]
+    # Key the request while this message is still the latest in the history;
+    # the task below may not start until other messages have been appended
+    request_key = make_request_key(channel_id, user_id)
 
-    # Process the message and generate a response
-    async with message.channel.typing():
-        response = await generate_response(
+    # Process the message and generate a response; generation starts before
+    # the typing indicator so the LLM request doesn't wait on Discord's API
+    response_task = asyncio.create_task(
+        generate_response(
             channel_id,
             user_id,
             user_name,
             user_discriminator,
             user_roles,
             user_top_role,
+            request_key,
         )
+    )
+    async with message.channel.typing():
+        response = await response_task
 
     # Send response, ensuring it doesn't exceed Discord's character limit
     if response:
@@ -111,7 +218,8 @@ async def on_message(message: discord.Message):
         if len(response) > 1990:  # Leave some buffer
             truncated_response = response[:1990] + "..."
             logger.warning(
-                f"Response was truncated from {len(response)} characters to 1990 characters"
+                "Response was truncated from %s characters to 1990 characters",
+                len(response),
             )
             response = truncated_response
 
@@ -125,7 +233,7 @@ async def on_message(message: discord.Message):
             )
             return
         except discord.HTTPException as e:
-            logger.error(f"Failed to send message: {str(e)}")
+            logger.error("Failed to send message: %s", e)
 
             # Try to send a shorter message if we still encountered an error
             if len(response) > 1000:
@@ -134,22 +242,116 @@ async def on_message(message: discord.Message):
                     short_response += "\n\n" + response[:900] + "..."
                     sent_message = await message.reply(short_response)
                 except Exception as e2:
-                    logger.error(f"Failed to send shortened message: {str(e2)}")
+                    logger.error("Failed to send shortened message: %s", e2)
                     return
             return
 
         # Add bot response to history
-        chat_histories[channel_id].append(
+        history.append(
             {
                 "role": "assistant",
                 "name": LLM.CHATBOT.BOT_CONFIG.BOT_NAME,
                 "content": response,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": int(time.time()),
             }
         )
 
-        # Save updated history
-        await save_chat_histories()
+        # Save updated history in the background
+        history_saver.schedule()
+
+
+def get_user_roles(member: discord.Member) -> List[str]:
+    """
+    Get the names of a member's roles, reusing them until the roles change.
+
+    Args:
+        member: Author of the message
+
+    Returns:
+        Names of the member's roles
+    """
+    roles = user_roles_cache.get(member.id)
+    if roles is not None:
+        return roles
+
+    roles = [role.name for role in member.roles]
+    # Only members in the guild cache get on_member_update events, so only
+    # their roles can be cached without going stale
+    if member.guild.get_member(member.id) is not None:
+        user_roles_cache[member.id] = roles
+    return roles
+
+
+@bot.listen("on_member_update")
+async def invalidate_user_roles(before: discord.Member, after: discord.Member):
+    """Drop a member's cached role names when their roles change."""
+    if before.roles != after.roles:
+        user_roles_cache.pop(after.id, None)
+
+
+@bot.listen("on_member_remove")
+async def forget_user_roles(member: discord.Member):
+    """Drop a departing member's cached role names."""
+    user_roles_cache.pop(member.id, None)
+
+
+@bot.listen("on_guild_role_update")
+async def invalidate_updated_roles(before: discord.Role, after: discord.Role):
+    """Drop all cached role names when a role is renamed or moved."""
+    # Member.roles is ordered by position, so a move changes cached lists too
+    if before.name != after.name or before.position != after.position:
+        user_roles_cache.clear()
+
+
+@bot.listen("on_guild_role_delete")
+async def invalidate_deleted_role(role: discord.Role):
+    """Drop all cached role names when a role is deleted."""
+    user_roles_cache.clear()
+
+
+def normalize_message(content: str) -> str:
+    """
+    Normalize a message so trivial variations count as the same request.
+
+    Args:
+        content: Raw message content
+
+    Returns:
+        Casefolded content without punctuation and with single spaces
+    """
+    content = PUNCTUATION_PATTERN.sub("", content.casefold())
+    return WHITESPACE_PATTERN.sub(" ", content).strip()
+
+
+def make_request_key(channel_id: str, user_id: str) -> Optional[str]:
+    """
+    Build the request key for the latest message in a channel.
+
+    Args:
+        channel_id: Channel the message was sent in
+        user_id: Author of the message
+
+    Returns:
+        Hex digest identifying the exchange, or None if the history is empty
+    """
+    history = chat_histories.get(channel_id)
+    if not history:
+        return None
+
+    content = history[-1].get("content", "")
+    # The bot's previous reply ties the key to the state of the conversation,
+    # so only a repeat of the same message at the same point matches
+    previous_reply = next(
+        (
+            entry.get("content", "")
+            for entry in reversed(history)
+            if entry.get("role") == "assistant"
+        ),
+        "",
+    )
+
+    raw = "\x1f".join((channel_id, user_id, normalize_message(content), previous_reply))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
 
 
 async def generate_response(
@@ -159,93 +361,134 @@ async def generate_response(
     user_discriminator: str,
     user_roles: List[str],
     user_top_role: str,
+    request_key: Optional[str] = None,
 ) -> Optional[str]:
-    """Generate a response using the LLM with context from chat history."""
+    """
+    Generate a response using the LLM with context from chat history.
+
+    Args:
+        channel_id: Channel the message was sent in
+        user_id: Author of the message
+        user_name: Author's display name
+        user_discriminator: Author's discriminator
+        user_roles: Names of the author's roles
+        user_top_role: Name of the author's top role
+        request_key: Key from make_request_key, taken when the message arrived;
+            concurrent requests with the same key share one response
+
+    Returns:
+        The response to send
+    """
     if not LLM.CHATBOT.API_KEY:
         logger.warning("No API key configured for chatbot LLM")
         return "I'm sorry, but I'm not fully configured yet."
 
+    # A repeat sent while the original is still being answered (e.g. a double
+    # post) shares its request instead of starting another one
+    future = None
+    if request_key is not None:
+        inflight = response_inflight.get(request_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        response_inflight[request_key] = future
+
+    response = None
     try:
-        # Create LLM client
-        llm_client = LLMClient(
-            api_key=LLM.CHATBOT.API_KEY,
-            api_url=LLM.CHATBOT.API_URL,
-            model=LLM.CHATBOT.MODEL,
-            max_retries=2,
-            retry_base_delay=1.0,
-            retry_max_delay=4.0,
-            request_timeout=15.0,
+        response = await request_response(
+            channel_id,
+            user_id,
+            user_name,
+            user_discriminator,
+            user_roles,
+            user_top_role,
         )
 
-        # Build messages for context
-        messages = []
+    except Exception as e:
+        logger.error("Failed to generate chatbot response: %s", e)
+        response = "I'm having trouble thinking right now. Can you try again in a moment?"
+
+    finally:
+        if future is not None:
+            del response_inflight[request_key]
+            future.set_result(response)
+
+    return response
 
-        # Format roles for prompt
-        roles_info = ", ".join(user_roles[:3]) if user_roles else "No special roles"
-        if len(user_roles) > 3:
-            roles_info += f" and {len(user_roles) - 3} more"
 
-        # System prompt to set the tone and behavior
-        system_prompt = LLMMessage(
+async def request_response(
+    channel_id: str,
+    user_id: str,
+    user_name: str,
+    user_discriminator: str,
+    user_roles: List[str],
+    user_top_role: str,
+) -> str:
+    """Build the prompt from chat history and request a response from the LLM."""
+    # Create LLM client
+    llm_client = LLMClient(
+        api_key=LLM.CHATBOT.API_KEY,
+        api_url=LLM.CHATBOT.API_URL,
+        model=LLM.CHATBOT.MODEL,
+        max_retries=2,
+        retry_base_delay=1.0,
+        retry_max_delay=4.0,
+        request_timeout=15.0,
+    )
+
+    # Build messages for context
+    messages = []
+
+    # Format roles for prompt
+    roles_info = ", ".join(user_roles[:3]) if user_roles else "No special roles"
+    if len(user_roles) > 3:
+        roles_info += f" and {len(user_roles) - 3} more"
+
+    # Static system prompt first, so the prompt prefix stays identical
+    # across turns and can be reused by the provider's prompt caching
+    messages.append(SYSTEM_PROMPT)
+
+    # Add chat history for context; the deque only holds the most recent
+    # MAX_HISTORY_ENTRIES entries
+    recent_history = chat_histories[channel_id]
+
+    # Add user identifiers to messages before sending to LLM
+    for entry in recent_history:
+        # Skip entries without proper role or content
+        if "role" not in entry or "content" not in entry:
+            continue
+
+        content = entry["content"]
+
+        # For user messages, add identifier prefix
+        if entry["role"] == "user":
+            user_identifier = entry.get("user_id", "unknown")
+            user_display = entry.get("name", "User")
+            modified_content = f"[User {user_identifier} ({user_display})]: {content}"
+            messages.append(LLMMessage(role="user", content=modified_content))
+        else:
+            messages.append(LLMMessage(role=entry["role"], content=content))
+
+    # Per-message details go last so they don't change the cached prefix
+    messages.append(
+        LLMMessage(
             role="system",
-            content=f"""You are {LLM.CHATBOT.BOT_CONFIG.BOT_NAME}, a friendly and helpful Discord bot. 
-            You are chatting in a Discord server with multiple users.
-            
-            USER INFORMATION:
-            - User ID: {user_id}
-            - Username: {user_name}#{user_discriminator}
-            - Top Role: {user_top_role}
-            - Roles: {roles_info}
-            
-            IMPORTANT GUIDELINES:
-            - Keep your responses concise and friendly
-            - Be conversational but brief (1-3 sentences unless a longer explanation is needed)
-            - Keep your conversation in English unless requested otherwise
-            - Make sure responses are formatted as per Discord's markdown rules
-            - Keep responses under 1,800 characters to avoid Discord message length limitations
-            - Use discord features like **bold**, *italic*, `code`, ```code blocks``` appropriately
-            
-            Track users by their unique user ID ({user_id}), not just their display name, 
-            as users may change their display names but will keep the same user ID.
-            """,
-        )
-        messages.append(system_prompt)
-
-        # Add chat history for context
-        history = chat_histories[channel_id]
-        # Only use the most recent history up to max_history
-        max_history = int(LLM.CHATBOT.BOT_CONFIG.CHATBOT_MAX_HISTORY)
-        recent_history = (
-            history[-max_history * 2 :] if len(history) > max_history * 2 else history
+            content=USER_CONTEXT_TEMPLATE.format(
+                user_id=user_id,
+                user_name=user_name,
+                user_discriminator=user_discriminator,
+                user_top_role=user_top_role,
+                roles_info=roles_info,
+            ),
         )
+    )
 
-        # Add user identifiers to messages before sending to LLM
-        for entry in recent_history:
-            # Skip entries without proper role or content
-            if "role" not in entry or "content" not in entry:
-                continue
-
-            content = entry["content"]
-
-            # For user messages, add identifier prefix
-            if entry["role"] == "user":
-                user_identifier = entry.get("user_id", "unknown")
-                user_display = entry.get("name", "User")
-                modified_content = (
-                    f"[User {user_identifier} ({user_display})]: {content}"
-                )
-                messages.append(LLMMessage(role="user", content=modified_content))
-            else:
-                messages.append(LLMMessage(role=entry["role"], content=content))
-
-        # Generate response
+    # Generate response
+    async with llm_semaphore:
         response = await llm_client.invoke(
             messages=messages,
             max_tokens=200,  # Reduced to help keep responses shorter
         )
 
-        return response.strip()
-
-    except Exception as e:
-        logger.error(f"Failed to generate chatbot response: {str(e)}")
-        return "I'm having trouble thinking right now. Can you try again in a moment?"
+    return response.strip()
@@ -7,6 +7,28 @@ from config import BOT, LLM
 from utils.llm import LLMClient, LLMMessage
 from utils.translator import Translator
 
+# Configured ID, parsed once rather than on every leave
+GOODBYE_CHANNEL_ID = (
+    int(BOT.GOODBYE.GOODBYE_CHANNEL_ID) if BOT.GOODBYE.GOODBYE_CHANNEL_ID else None
+)
+
+# Default goodbye messages used when the LLM is unavailable
+DEFAULT_GOODBYE_MESSAGES = (
+    "We'll miss you, {member_name}! Hope to see you again soon!",
+    "Sorry to see you go, {member_name}. The door is always open if you decide to return!",
+    "{member_name} has left the server. Wishing you all the best!",
+    "Until we meet again, {member_name}! Take care!",
+    "Farewell, {member_name}! Thank you for being part of our community!",
+)
+
+# Prompt for the LLM goodbye message; only the member details vary per leave
+GOODBYE_PROMPT_TEMPLATE = """Generate a brief, thoughtful goodbye message for a Discord user named {member_name}
+who just left the server {guild_name}.
+The message should be 1-2 sentences, respectful, and wishing them well.
+Don't use hashtags or emojis and only English.
+The server's primary language is {language}.
+"""
+
 
 @bot.event
 async def on_member_remove(member):
@@ -16,22 +38,24 @@ async def on_member_remove(member):
         return
 
     # Log the member leaving
-    logger.info(f"Member left: {member.name}#{member.discriminator} (ID: {member.id})")
+    logger.info(
+        "Member left: %s#%s (ID: %s)", member.name, member.discriminator, member.id
+    )
 
     # Send goodbye message if goodbye channel is configured
-    if BOT.GOODBYE.GOODBYE_CHANNEL_ID:
+    if GOODBYE_CHANNEL_ID:
         try:
-            channel = member.guild.get_channel(int(BOT.GOODBYE.GOODBYE_CHANNEL_ID))
+            channel = member.guild.get_channel(GOODBYE_CHANNEL_ID)
             if channel:
                 # Create and send goodbye embed
                 embed = await create_goodbye_embed(member)
                 await channel.send(embed=embed)
             else:
                 logger.warning(
-                    f"Goodbye channel with ID {BOT.GOODBYE.GOODBYE_CHANNEL_ID} not found"
+                    "Goodbye channel with ID %s not found", GOODBYE_CHANNEL_ID
                 )
         except Exception as e:
-            logger.error(f"Failed to send goodbye message for {member.name}: {str(e)}")
+            logger.error("Failed to send goodbye message for %s: %s", member.name, e)
 
 
 async def create_goodbye_embed(member):
@@ -46,17 +70,13 @@ async def create_goodbye_embed(member):
     )
 
     # Add member info
-    embed.add_field(name="Member", value=f"{member.name}", inline=True)
-    embed.add_field(
-        name="Joined Server",
-        value=f"<t:{int(member.joined_at.timestamp()) if member.joined_at else 0}:R>",
-        inline=True,
-    )
-    embed.add_field(
-        name="New Member Count",
-        value=f"{member.guild.member_count} members",
-        inline=True,
-    )
+    joined_at = int(member.joined_at.timestamp()) if member.joined_at else 0
+    for name, value in (
+        ("Member", member.name),
+        ("Joined Server", f"<t:{joined_at}:R>"),
+        ("New Member Count", f"{member.guild.member_count} members"),
+    ):
+        embed.add_field(name=name, value=value, inline=True)
 
     # Add member avatar if available
     if member.avatar:
@@ -79,15 +99,6 @@ async def generate_goodbye_message(member, language=None):
     if language is None:
         language = await Translator.get_translation_language()
 
-    # Default goodbye messages as fallback
-    default_messages = [
-        f"We'll miss you, {member.name}! Hope to see you again soon!",
-        f"Sorry to see you go, {member.name}. The door is always open if you decide to return!",
-        f"{member.name} has left the server. Wishing you all the best!",
-        f"Until we meet again, {member.name}! Take care!",
-        f"Farewell, {member.name}! Thank you for being part of our community!",
-    ]
-
     # Try to use LLM for a personalized goodbye if configured
     if LLM.GOODBYE.API_KEY:
         try:
@@ -99,12 +110,11 @@ async def generate_goodbye_message(member, language=None):
 
             prompt = LLMMessage(
                 role="user",
-                content=f"""Generate a brief, thoughtful goodbye message for a Discord user named {member.name} 
-                who just left the server {member.guild.name}.
-                The message should be 1-2 sentences, respectful, and wishing them well.
-                Don't use hashtags or emojis and only English.
-                The server's primary language is {language}.
-                """,
+                content=GOODBYE_PROMPT_TEMPLATE.format(
+                    member_name=member.name,
+                    guild_name=member.guild.name,
+                    language=language,
+                ),
             )
 
             response = await llm_client.invoke(
@@ -115,7 +125,7 @@ async def generate_goodbye_message(member, language=None):
                 return response
 
         except Exception as e:
-            logger.error(f"Failed to generate LLM goodbye message: {str(e)}")
+            logger.error("Failed to generate LLM goodbye message: %s", e)
 
     # Fallback to random default message
-    return random.choice(default_messages)
+    return random.choice(DEFAULT_GOODBYE_MESSAGES).format(member_name=member.name)
@@ -4,8 +4,32 @@ import random
 from bot import bot, logger
 from config import BOT, LLM
 from utils.llm import LLMClient, LLMMessage
+from utils.tasks import spawn_background
 from utils.translator import Translator
 
+# Configured IDs, parsed once rather than on every join
+WELCOME_CHANNEL_ID = (
+    int(BOT.WELCOME.WELCOME_CHANNEL_ID) if BOT.WELCOME.WELCOME_CHANNEL_ID else None
+)
+WELCOME_ROLE_ID = int(BOT.WELCOME.ROLE_ID) if BOT.WELCOME.ROLE_ID else None
+
+# Default welcome messages used when the LLM is unavailable
+DEFAULT_WELCOME_MESSAGES = (
+    "Welcome to our community, {member_name}! Feel free to introduce yourself!",
+    "So glad to have you with us, {member_name}! Make yourself at home!",
+    "A new friend has arrived! Welcome to {guild_name}, {member_name}!",
+    "The community just got better with {member_name} joining us!",
+    "Hello there, {member_name}! We're excited to have you join our server!",
+)
+
+# Prompt for the LLM welcome message; only the member details vary per join
+WELCOME_PROMPT_TEMPLATE = """Generate a friendly, warm welcome message for a new Discord user named {member_name}
+who just joined the server {guild_name}.
+{name_info}
+The message should be 2-3 sentences, conversational, and welcoming.
+Don't use hashtags or emojis and only English.
+"""
+
 
 @bot.event
 async def on_member_join(member):
@@ -16,13 +40,24 @@ async def on_member_join(member):
 
     # Log the new member
     logger.info(
-        f"Member joined: {member.name}#{member.discriminator} (ID: {member.id})"
+        "Member joined: %s#%s (ID: %s)", member.name, member.discriminator, member.id
     )
 
+    # Check permissions locally instead of letting Discord reject the request
+    me = member.guild.me
+    bot_permissions = me.guild_permissions
+
+    # Assign the default role in the background; it doesn't depend on the
+    # translation, so it shouldn't wait behind the LLM request
+    if WELCOME_ROLE_ID:
+        spawn_background(assign_welcome_role(member, me, bot_permissions))
+
     # Get the configured translation language from persistent settings
     translation_language = await Translator.get_translation_language()
 
-    # Translate the member's display name to the configured language
+    # Translate the member's display name to the configured language;
+    # translate_name skips the LLM for non-latin names and serves names that
+    # were translated before (e.g. a returning member) from the cache
     translated_name = await Translator.translate_name(
         member.display_name, translation_language
     )
@@ -30,27 +65,22 @@ async def on_member_join(member):
     # Set the new nickname
     try:
         if translated_name and translated_name != member.display_name:
-            await member.edit(nick=translated_name)
-            logger.info(f"Changed nickname for {member.name} to {translated_name}")
-    except Exception as e:
-        logger.error(f"Failed to set nickname for {member.name}: {str(e)}")
-
-    # Assign the default role if configured
-    if BOT.WELCOME.ROLE_ID:
-        try:
-            role = member.guild.get_role(int(BOT.WELCOME.ROLE_ID))
-            if role:
-                await member.add_roles(role)
-                logger.info(f"Assigned role '{role.name}' to {member.name}")
+            if bot_permissions.manage_nicknames and me.top_role > member.top_role:
+                await member.edit(nick=translated_name)
+                logger.info(
+                    "Changed nickname for %s to %s", member.name, translated_name
+                )
             else:
-                logger.warning(f"Role with ID {BOT.WELCOME.ROLE_ID} not found")
-        except Exception as e:
-            logger.error(f"Failed to assign role to {member.name}: {str(e)}")
+                logger.warning(
+                    "Missing permissions to set nickname for %s", member.name
+                )
+    except Exception as e:
+        logger.error("Failed to set nickname for %s: %s", member.name, e)
 
     # Send welcome message if welcome channel is configured
-    if BOT.WELCOME.WELCOME_CHANNEL_ID:
+    if WELCOME_CHANNEL_ID:
         try:
-            channel = member.guild.get_channel(int(BOT.WELCOME.WELCOME_CHANNEL_ID))
+            channel = member.guild.get_channel(WELCOME_CHANNEL_ID)
             if channel:
                 # Create and send welcome embed
                 embed = await create_welcome_embed(
@@ -59,10 +89,29 @@ async def on_member_join(member):
                 await channel.send(content=f"Welcome {member.mention}!", embed=embed)
             else:
                 logger.warning(
-                    f"Welcome channel with ID {BOT.WELCOME.WELCOME_CHANNEL_ID} not found"
+                    "Welcome channel with ID %s not found", WELCOME_CHANNEL_ID
                 )
         except Exception as e:
-            logger.error(f"Failed to send welcome message for {member.name}: {str(e)}")
+            logger.error("Failed to send welcome message for %s: %s", member.name, e)
+
+
+async def assign_welcome_role(member, me, bot_permissions):
+    """Assigns the configured welcome role to a new member."""
+    try:
+        role = member.guild.get_role(WELCOME_ROLE_ID)
+        if role is None:
+            logger.warning("Role with ID %s not found", WELCOME_ROLE_ID)
+        elif bot_permissions.manage_roles and me.top_role > role:
+            await member.add_roles(role)
+            logger.info("Assigned role '%s' to %s", role.name, member.name)
+        else:
+            logger.warning(
+                "Missing permissions to assign role '%s' to %s",
+                role.name,
+                member.name,
+            )
+    except Exception as e:
+        logger.error("Failed to assign role to %s: %s", member.name, e)
 
 
 async def create_welcome_embed(member, translated_name=None, language=None):
@@ -117,15 +166,6 @@ async def generate_welcome_message(member, translated_name=None, language=None):
     if language is None:
         language = await Translator.get_translation_language()
 
-    # Default welcome messages as fallback
-    default_messages = [
-        f"Welcome to our community, {member.name}! Feel free to introduce yourself!",
-        f"So glad to have you with us, {member.name}! Make yourself at home!",
-        f"A new friend has arrived! Welcome to {member.guild.name}, {member.name}!",
-        f"The community just got better with {member.name} joining us!",
-        f"Hello there, {member.name}! We're excited to have you join our server!",
-    ]
-
     # Try to use LLM for a personalized welcome if configured
     if LLM.WELCOME.API_KEY:
         try:
@@ -143,12 +183,11 @@ async def generate_welcome_message(member, translated_name=None, language=None):
 
             prompt = LLMMessage(
                 role="user",
-                content=f"""Generate a friendly, warm welcome message for a new Discord user named {member.name} 
-                who just joined the server {member.guild.name}.
-                {name_info}
-                The message should be 2-3 sentences, conversational, and welcoming.
-                Don't use hashtags or emojis and only English.
-                """,
+                content=WELCOME_PROMPT_TEMPLATE.format(
+                    member_name=member.name,
+                    guild_name=member.guild.name,
+                    name_info=name_info,
+                ),
             )
 
             response = await llm_client.invoke(
@@ -159,7 +198,9 @@ async def generate_welcome_message(member, translated_name=None, language=None):
                 return response
 
         except Exception as e:
-            logger.error(f"Failed to generate LLM welcome message: {str(e)}")
+            logger.error("Failed to generate LLM welcome message: %s", e)
 
     # Fallback to random default message
-    return random.choice(default_messages)
+    return random.choice(DEFAULT_WELCOME_MESSAGES).format(
+        member_name=member.name, guild_name=member.guild.name
+    )
@@ -1,11 +1,18 @@
+import sys
 import asyncio
-import traceback
 
 from config import BOT
 from bot import bot, logger
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 async def main():
+    loop = asyncio.get_running_loop()
+    logger.info("Running on %s.%s", type(loop).__module__, type(loop).__name__)
 
     if not BOT.BOT_TOKEN:
         logger.critical("No BOT_TOKEN found in environment variables!")
@@ -21,9 +28,12 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped by user (KeyboardInterrupt).")
     except Exception as e:
-        logger.critical(f"Bot crashed: {str(e)}")
-        logger.critical(traceback.format_exc())
+        logger.critical("Bot crashed: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's faster event loop when it is installed
+    if uvloop is not None and sys.platform != "win32":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
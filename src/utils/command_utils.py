@@ -1,8 +1,12 @@
 import discord
 from discord.ext import commands
+from typing import Callable, Dict, List, Optional, Type, Union
 
 from bot import bot, logger
 
+# A static error message, or a function building one from the error
+ErrorMessage = Union[str, Callable[[Exception], str]]
+
 
 def register_commands_help() -> None:
     """Register help information for all commands."""
@@ -67,13 +71,60 @@ async def check_command_permissions(
     # Check for specific permission
     required_permission = getattr(discord.Permissions, permission_name, None)
     if required_permission is None:
-        logger.error(f"Invalid permission name: {permission_name}")
+        logger.error("Invalid permission name: %s", permission_name)
         return False
 
     # Check if user has the permission
     return getattr(ctx.author.guild_permissions, permission_name, False)
 
 
+# Human-readable permission names, e.g. "manage_guild" -> "Manage Server"
+PERMISSION_NAMES = {
+    name: name.replace("_", " ").replace("guild", "server").title()
+    for name in discord.Permissions.VALID_FLAGS
+}
+
+
+def describe_permissions(permission_names: List[str]) -> str:
+    """
+    Format permission flag names for a user-facing message.
+
+    Args:
+        permission_names: Permission flag names, e.g. from error.missing_permissions
+
+    Returns:
+        Comma-separated human-readable permission names
+    """
+    return ", ".join(PERMISSION_NAMES.get(name, name) for name in permission_names)
+
+
+def lookup_error_message(
+    messages: Dict[Type[Exception], ErrorMessage], error: Exception
+) -> Optional[str]:
+    """
+    Find the user-facing message for a command error.
+
+    Args:
+        messages: Mapping of error types to messages or message builders
+        error: The error raised by the command
+
+    Returns:
+        The message for the error's type or nearest base class, or None
+    """
+    # Exact type match is the common case; walk the MRO for subclasses
+    message = messages.get(type(error))
+    if message is None:
+        for error_type in type(error).__mro__[1:]:
+            message = messages.get(error_type)
+            if message is not None:
+                break
+
+    if callable(message):
+        return message(error)
+
+    return message
+
+
 def setup_commands():
     """
     Set up commands and their metadata after bot initialization.
@@ -85,4 +136,4 @@ def setup_commands():
 
         logger.info("Command utilities set up successfully")
     except Exception as e:
-        logger.error(f"Error setting up command utilities: {str(e)}")
+        logger.error("Error setting up command utilities: %s", e)
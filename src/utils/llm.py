@@ -1,12 +1,60 @@
+import httpx
+import random
 import asyncio
 import logging
-from openai import AsyncOpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
 from pydantic import BaseModel, Field
 from typing import Optional, List, Callable
 
 
 logger = logging.getLogger(__name__)
 
+# Common error types to retry on (lowercase, matched against the error message)
+DEFAULT_RETRY_ERRORS = (
+    "rate_limit",
+    "timeout",
+    "connection",
+    "server_error",
+    "500",
+    "502",
+    "503",
+    "504",
+    "capacity",
+    "overloaded",
+)
+
+# Exception types for errors that are likely to clear up on their own
+TRANSIENT_ERROR_TYPES = (
+    APIConnectionError,  # Includes request timeouts
+    RateLimitError,
+    InternalServerError,
+    httpx.TransportError,
+    asyncio.TimeoutError,
+)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Check whether an LLM request failed for a temporary reason, such as a rate
+    limit, timeout, connection problem or server error
+
+    Args:
+        error: The exception raised by the request
+
+    Returns:
+        True if retrying the request later may succeed
+    """
+    if isinstance(error, TRANSIENT_ERROR_TYPES):
+        return True
+
+    error_msg = str(error).lower()
+    return any(retry_error in error_msg for retry_error in DEFAULT_RETRY_ERRORS)
+
 
 class LLMMessage(BaseModel):
     role: str = Field(..., description="Role of the message sender")
@@ -14,6 +62,10 @@ class LLMMessage(BaseModel):
 
 
 class LLMClient:
+    # HTTP connection pool shared by every client, so LLM requests reuse
+    # keep-alive connections instead of paying a new TLS handshake each time
+    _http_client: Optional[httpx.AsyncClient] = None
+
     def __init__(
         self,
         api_key: str,
@@ -38,13 +90,74 @@ class LLMClient:
         """
         self.model = model
         self.client = AsyncOpenAI(
-            api_key=api_key, base_url=api_url, timeout=request_timeout
+            api_key=api_key,
+            base_url=api_url,
+            timeout=request_timeout,
+            http_client=LLMClient.get_http_client(),
         )
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
         self.retry_max_delay = retry_max_delay
         self.request_timeout = request_timeout
 
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use
+
+        Returns:
+            The pooled HTTP client used for all LLM requests
+        """
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=20,
+                    # Idle connections, including the ones opened by prewarm()
+                    # during setup, are dropped after this long; raising it
+                    # keeps the pool warm for a slow first event, at the cost
+                    # of holding more idle sockets open
+                    keepalive_expiry=60.0,
+                ),
+                follow_redirects=True,
+            )
+        return cls._http_client
+
+    @classmethod
+    async def prewarm(cls, api_urls: List[str], timeout: float = 5.0) -> bool:
+        """
+        Open pooled connections to the given API hosts ahead of the first request.
+        The connections only stay pooled for the keep-alive expiry, so a first
+        request that comes later than that opens a new connection anyway
+
+        Args:
+            api_urls: Base URLs of the LLM APIs to connect to
+            timeout: Timeout for each warm-up request (in seconds)
+
+        Returns:
+            True if a connection was opened to every host
+        """
+        http_client = cls.get_http_client()
+
+        async def warm(api_url: str) -> bool:
+            try:
+                await http_client.head(api_url, timeout=timeout)
+                return True
+            except Exception as e:
+                # Warm-up is best effort; the real request will retry normally
+                logger.debug("Failed to prewarm connection to %s: %s", api_url, e)
+                return False
+
+        results = await asyncio.gather(*(warm(api_url) for api_url in set(api_urls)))
+        return all(results)
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     async def invoke(
         self,
         messages: List[LLMMessage],
@@ -70,23 +183,10 @@ class LLMClient:
         # Convert LLMMessage objects to dictionaries
         message_dicts = [{"role": msg.role, "content": msg.content} for msg in messages]
 
-        # Common error types to retry on
-        default_retry_errors = [
-            "rate_limit",
-            "timeout",
-            "connection",
-            "server_error",
-            "500",
-            "502",
-            "503",
-            "504",
-            "capacity",
-            "overloaded",
-        ]
-
-        retry_errors = default_retry_errors
+        # Error substrings to retry on, lowercased once up front
+        retry_errors = DEFAULT_RETRY_ERRORS
         if retry_on_specific_errors:
-            retry_errors.extend(retry_on_specific_errors)
+            retry_errors += tuple(error.lower() for error in retry_on_specific_errors)
 
         # Initialize retry counter
         attempt = 0
@@ -100,7 +200,7 @@ class LLMClient:
                 # Log the attempt if it's a retry
                 if attempt > 1:
                     logger.info(
-                        f"LLM API retry attempt {attempt}/{self.max_retries + 1}"
+                        "LLM API retry attempt %s/%s", attempt, self.max_retries + 1
                     )
 
                 # Send the request to the API
@@ -118,14 +218,14 @@ class LLMClient:
                 # Check if error is in retryable errors list
                 should_retry = False
                 for retry_error in retry_errors:
-                    if retry_error.lower() in error_msg:
+                    if retry_error in error_msg:
                         should_retry = True
                         break
 
                 # If reached max retries or error isn't retryable, raise the exception
                 if attempt > self.max_retries or not should_retry:
                     logger.error(
-                        f"LLM API request failed after {attempt} attempts: {str(e)}"
+                        "LLM API request failed after %s attempts: %s", attempt, e
                     )
                     raise
 
@@ -134,12 +234,16 @@ class LLMClient:
                     self.retry_max_delay, self.retry_base_delay * (2 ** (attempt - 1))
                 )
                 # Add jitter (±20%)
-                jitter = 0.2 * delay * (asyncio.random() * 2 - 1)
+                jitter = 0.2 * delay * (random.random() * 2 - 1)
                 delay = max(0.1, delay + jitter)
 
                 logger.warning(
-                    f"LLM API request failed (attempt {attempt}/{self.max_retries + 1}): {str(e)}. "
-                    f"Retrying in {delay:.2f} seconds..."
+                    "LLM API request failed (attempt %s/%s): %s. "
+                    "Retrying in %.2f seconds...",
+                    attempt,
+                    self.max_retries + 1,
+                    e,
+                    delay,
                 )
 
                 # Wait before retrying
@@ -174,5 +278,5 @@ class LLMClient:
         try:
             return await self.invoke(messages, model_name, **kwargs)
         except Exception as e:
-            logger.warning(f"LLM API request failed, using fallback: {str(e)}")
+            logger.warning("LLM API request failed, using fallback: %s", e)
             return fallback_fn()
@@ -1,11 +1,17 @@
 import os
+import queue
+import atexit
 import logging
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 
 class LoggingManager:
     """Utility class for setting up logging configurations."""
 
+    # Background listeners writing queued log records, keyed by logger name
+    _listeners: Dict[str, QueueListener] = {}
+
     @staticmethod
     def setup_logger(
         name: str,
@@ -32,8 +38,12 @@ class LoggingManager:
         logger = logging.getLogger(name)
         logger.setLevel(level)
 
-        # Clear existing handlers
-        logger.handlers = []
+        # Close and clear existing handlers, so setting up the same logger twice
+        # doesn't leave the previous log file open
+        LoggingManager.stop_listener(name)
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
 
         # Format for log messages
         formatter = logging.Formatter(
@@ -41,11 +51,13 @@ class LoggingManager:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
+        handlers = []
+
         # Add console handler
         if console_output:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
 
         # Add file handler
         if file_output:
@@ -61,8 +73,41 @@ class LoggingManager:
                     filename, mode=file_mode, encoding="utf-8", errors="replace"
                 )
                 file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                handlers.append(file_handler)
             else:
                 raise ValueError("Filename must be provided when file_output is True")
 
+        # Log calls only enqueue the record; a background thread does the
+        # blocking console and file writes, keeping them off the event loop
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            LoggingManager._listeners[name] = listener
+
         return logger
+
+    @staticmethod
+    def stop_listener(name: str) -> None:
+        """
+        Stop a logger's background listener, writing out any queued records.
+
+        Args:
+            name: Name of the logger
+        """
+        listener = LoggingManager._listeners.pop(name, None)
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    @staticmethod
+    def stop_all_listeners() -> None:
+        """Stop every background listener, writing out any queued records."""
+        for name in list(LoggingManager._listeners):
+            LoggingManager.stop_listener(name)
+
+
+# Make sure queued records are written before the interpreter exits
+atexit.register(LoggingManager.stop_all_listeners)
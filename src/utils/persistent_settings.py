@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class PersistentSettings:
@@ -11,6 +11,7 @@ class PersistentSettings:
     _instance = None
     _settings: Dict[str, Any] = {}
     _settings_file = "data/settings.json"
+    _settings_mtime: Optional[float] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -27,20 +28,35 @@ class PersistentSettings:
         # Try to load existing settings
         if os.path.exists(cls._settings_file):
             try:
+                cls._settings_mtime = os.path.getmtime(cls._settings_file)
                 with open(cls._settings_file, "r", encoding="utf-8") as f:
                     cls._settings = json.load(f)
             except Exception as e:
                 print(f"Error loading settings: {str(e)}")
                 cls._settings = {}
         else:
+            cls._settings_mtime = None
             cls._settings = {}
 
+    @classmethod
+    def _reload_if_changed(cls) -> None:
+        """Reload settings only if the JSON file changed since it was last read."""
+        try:
+            mtime = os.path.getmtime(cls._settings_file)
+        except OSError:
+            mtime = None
+
+        if mtime != cls._settings_mtime:
+            cls._load_settings()
+
     @classmethod
     def _save_settings(cls) -> None:
         """Save settings to the JSON file."""
         try:
             with open(cls._settings_file, "w", encoding="utf-8") as f:
                 json.dump(cls._settings, f, ensure_ascii=False, indent=2)
+            # The in-memory settings already match what was just written
+            cls._settings_mtime = os.path.getmtime(cls._settings_file)
         except Exception as e:
             print(f"Error saving settings: {str(e)}")
 
@@ -56,7 +72,7 @@ class PersistentSettings:
         Returns:
             The setting value or default
         """
-        cls._load_settings()  # Ensure we have the latest settings
+        cls._reload_if_changed()  # Ensure we have the latest settings
         return cls._settings.get(key, default)
 
     @classmethod
@@ -79,5 +95,5 @@ class PersistentSettings:
         Returns:
             Dictionary containing all settings
         """
-        cls._load_settings()  # Ensure we have the latest settings
+        cls._reload_if_changed()  # Ensure we have the latest settings
         return cls._settings.copy()
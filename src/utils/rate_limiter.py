@@ -0,0 +1,44 @@
+import time
+import asyncio
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter for coroutines.
+    Waiters sleep outside the lock, so a caller waiting for a token never
+    blocks other callers from checking the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Number of tokens added per second
+            capacity: Maximum number of tokens the bucket can hold (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            await asyncio.sleep(wait)
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Awaitable, Callable, Coroutine, Optional, Set
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+background_tasks: Set[asyncio.Task] = set()
+
+
+def spawn_background(coro: Coroutine) -> asyncio.Task:
+    """
+    Run a coroutine as a fire-and-forget task.
+
+    Args:
+        coro: Coroutine to run; it should handle and log its own errors
+
+    Returns:
+        The started task
+    """
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+class DebouncedSave:
+    """
+    Runs a save coroutine shortly after data changes, so a burst of changes
+    is written once. The save must snapshot the data before its first await.
+    """
+
+    def __init__(self, save: Callable[[], Awaitable[None]], delay: float):
+        """
+        Initialize the debounced save.
+
+        Args:
+            save: Coroutine function that writes the current data
+            delay: Seconds to wait after a change before saving
+        """
+        self.save = save
+        self.delay = delay
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self) -> None:
+        """Mark the data as changed and start a save unless one is running."""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Wait until pending changes are saved, e.g. before shutting down."""
+        if self._task is not None and not self._task.done():
+            await self._task
+
+    async def _run(self) -> None:
+        """Save until no changes are left that the last snapshot missed."""
+        while self._dirty:
+            await asyncio.sleep(self.delay)
+            # Changes made from here on aren't in this save's snapshot, so
+            # they mark the data dirty again and get another pass
+            self._dirty = False
+            await self.save()
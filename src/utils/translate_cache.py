@@ -0,0 +1,283 @@
+import os
+import json
+import asyncio
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from config import LLM
+from bot import logger
+from utils.tasks import DebouncedSave
+
+
+class TranslationCache:
+    """
+    LRU cache for name translations, persisted to disk across bot restarts.
+    Display names repeat heavily across a guild, so most translations can be
+    served from here without a round-trip to the LLM.
+    """
+
+    def __init__(
+        self,
+        cache_file: str,
+        max_entries: int = 10000,
+        ttl: float = 7 * 24 * 60 * 60,
+        failure_ttl: float = 10 * 60,
+        save_delay: float = 1.0,
+    ):
+        """
+        Initialize the translation cache.
+
+        Args:
+            cache_file: Path to the JSON file used for persistence
+            max_entries: Maximum number of translations kept in the cache
+            ttl: Time in seconds before a cached translation expires
+            failure_ttl: Time in seconds a failed translation is remembered
+            save_delay: Time in seconds to wait after a change before saving
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Names the LLM recently failed to translate, so repeated lookups don't
+        # keep re-sending requests that are likely to fail again (memory only)
+        self._failures: "OrderedDict[str, float]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Writes are debounced, so a run of new translations is saved once
+        self._saver = DebouncedSave(self._save, save_delay)
+        self._load()
+
+    @staticmethod
+    def make_key(name: str, language: str) -> str:
+        """
+        Build the cache key for a name/language pair.
+
+        Args:
+            name: The name being translated
+            language: Target language for translation
+
+        Returns:
+            Hex digest identifying the translation
+        """
+        raw = f"{language.strip().casefold()}:{name.strip().casefold()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, name: str, language: str) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Args:
+            name: The name being translated
+            language: Target language for translation
+
+        Returns:
+            The cached translation or None if not cached
+        """
+        key = self.make_key(name, language)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        translated_name, created_at = entry
+        if time.time() - created_at > self.ttl:
+            del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return translated_name
+
+    def peek(self, name: str, language: str) -> Optional[str]:
+        """
+        Look up a cached translation without counting it as a cache hit or miss
+        or refreshing its LRU position, for internal checks that aren't lookups.
+
+        Args:
+            name: The name being translated
+            language: Target language for translation
+
+        Returns:
+            The cached translation or None if not cached or expired
+        """
+        entry = self._entries.get(self.make_key(name, language))
+        if entry is None:
+            return None
+
+        translated_name, created_at = entry
+        if time.time() - created_at > self.ttl:
+            return None
+
+        return translated_name
+
+    async def set(self, name: str, language: str, translated_name: str) -> None:
+        """
+        Store a translation in the cache.
+
+        Args:
+            name: The name that was translated
+            language: Target language for translation
+            translated_name: The translated name
+        """
+        await self.set_many({name: translated_name}, language)
+
+    async def set_many(self, translations: Dict[str, str], language: str) -> None:
+        """
+        Store several translations in the cache with a single save.
+
+        Args:
+            translations: Translated names keyed by the original name
+            language: Target language for translation
+        """
+        if not translations:
+            return
+
+        created_at = time.time()
+        for name, translated_name in translations.items():
+            key = self.make_key(name, language)
+            self._entries[key] = (translated_name, created_at)
+            self._entries.move_to_end(key)
+            self._failures.pop(key, None)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        self._saver.schedule()
+
+    async def flush(self) -> None:
+        """Wait for pending writes to the cache file, e.g. before shutting down."""
+        await self._saver.flush()
+
+    def is_known_failure(self, name: str, language: str) -> bool:
+        """
+        Check whether translating a name recently failed.
+
+        Args:
+            name: The name being translated
+            language: Target language for translation
+
+        Returns:
+            True if a translation failure was recorded within failure_ttl
+        """
+        key = self.make_key(name, language)
+        failed_at = self._failures.get(key)
+
+        if failed_at is None:
+            return False
+
+        if time.monotonic() - failed_at > self.failure_ttl:
+            del self._failures[key]
+            return False
+
+        return True
+
+    def record_failure(self, name: str, language: str) -> None:
+        """
+        Remember that translating a name failed.
+
+        Args:
+            name: The name that failed to translate
+            language: Target language for translation
+        """
+        key = self.make_key(name, language)
+        self._failures[key] = time.monotonic()
+        self._failures.move_to_end(key)
+
+        while len(self._failures) > self.max_entries:
+            self._failures.popitem(last=False)
+
+    async def coalesce(
+        self,
+        name: str,
+        language: str,
+        fetch: Callable[[], Awaitable[Optional[str]]],
+    ) -> Optional[str]:
+        """
+        Run a translation request, sharing its result with any concurrent
+        callers asking for the same name and language.
+
+        Args:
+            name: The name being translated
+            language: Target language for translation
+            fetch: Coroutine factory performing the actual request
+
+        Returns:
+            The translation returned by fetch, or None if it failed
+        """
+        key = self.make_key(name, language)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        translated_name = None
+        try:
+            translated_name = await fetch()
+            return translated_name
+        finally:
+            del self._inflight[key]
+            future.set_result(translated_name)
+
+    def _load(self) -> None:
+        """Load cached translations from the JSON file."""
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+
+        if not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+
+            now = time.time()
+            for key, (translated_name, created_at) in entries.items():
+                if now - created_at <= self.ttl:
+                    self._entries[key] = (translated_name, created_at)
+
+            logger.info("Loaded %s cached translations", len(self._entries))
+        except Exception as e:
+            logger.error("Failed to load translation cache: %s", e)
+            self._entries = OrderedDict()
+
+    async def _save(self) -> None:
+        """Save cached translations to the JSON file."""
+        # Snapshot on the event loop so the cache can't change mid-write
+        entries = dict(self._entries)
+
+        try:
+            # Serializing and writing the file blocks, so it runs in a worker thread
+            await asyncio.to_thread(self._write, entries)
+        except Exception as e:
+            logger.error("Failed to save translation cache: %s", e)
+
+    def _write(self, entries: Dict[str, Tuple[str, float]]) -> None:
+        """
+        Write a snapshot of the cached translations to the JSON file.
+
+        Args:
+            entries: Cached translations by key
+        """
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+
+# Shared cache instance used by the translator
+translation_cache = TranslationCache(
+    cache_file=LLM.TRANSLATOR.CACHE_FILE,
+    max_entries=LLM.TRANSLATOR.CACHE_MAX_ENTRIES,
+    ttl=LLM.TRANSLATOR.CACHE_TTL,
+    failure_ttl=LLM.TRANSLATOR.CACHE_FAILURE_TTL,
+    save_delay=LLM.TRANSLATOR.CACHE_SAVE_DELAY,
+)
@@ -1,7 +1,27 @@
+import re
+import json
+import functools
+from typing import Dict, List, Optional
+
 from config import LLM
 from bot import logger
-from utils.llm import LLMClient, LLMMessage
+from utils.llm import LLMClient, LLMMessage, is_transient_error
 from utils.persistent_settings import PersistentSettings
+from utils.rate_limiter import AsyncTokenBucket
+from utils.translate_cache import translation_cache
+
+# Matches any character outside the ASCII range
+NON_LATIN_PATTERN = re.compile(r"[^\x00-\x7f]")
+
+# Quotes stripped from translations, and characters that end the name when
+# the LLM adds an explanation after it
+QUOTES_PATTERN = re.compile(r"[\"']")
+NAME_END_PATTERN = re.compile(r"[.,\n ]")
+
+# Paces translation requests sent to the LLM
+translation_rate_limiter = AsyncTokenBucket(
+    rate=LLM.TRANSLATOR.REQUESTS_PER_SECOND, capacity=LLM.TRANSLATOR.REQUEST_BURST
+)
 
 
 class Translator:
@@ -25,65 +45,229 @@ class Translator:
         Returns:
             Translated name or original if translation fails
         """
+        # Skip translation if name is already in non-latin characters
+        if Translator.is_non_latin(name):
+            return name
+
         # If no language specified, get from settings
         if language is None:
             language = await Translator.get_translation_language()
 
-        # Skip translation if name is already in non-latin characters
-        if any(ord(char) > 127 for char in name):
+        # Serve repeated names from the cache instead of calling the LLM
+        cached_name = await translation_cache.get(name, language)
+        if cached_name is not None:
+            return cached_name
+
+        # Don't retry a name the LLM just failed to translate
+        if translation_cache.is_known_failure(name, language):
             return name
 
-        if LLM.TRANSLATOR.API_KEY:
-            try:
-                # Create LLM client
-                llm_client = LLMClient(
-                    api_key=LLM.TRANSLATOR.API_KEY,
-                    api_url=LLM.TRANSLATOR.API_URL,
-                    model=LLM.TRANSLATOR.MODEL,
-                    max_retries=3,
-                    retry_base_delay=1.0,
-                    retry_max_delay=8.0,
-                    request_timeout=10.0,
-                )
+        # Concurrent callers translating the same name share one LLM request
+        translated_name = await translation_cache.coalesce(
+            name, language, lambda: Translator._request_translation(name, language)
+        )
 
-                prompt = LLMMessage(
-                    role="user",
-                    content=f"""Translate the name "{name}" to {language}.
-                    If the name has a common {language} equivalent, use that.
-                    Otherwise, use phonetic representation that sounds similar in {language}.
-                    Just provide the translated name without explanation.
-                    """,
-                )
+        # Return original name if translation fails
+        return translated_name or name
+
+    @staticmethod
+    async def _request_translation(name: str, language: str) -> Optional[str]:
+        """
+        Requests a single name translation from the LLM and caches the result.
+
+        Args:
+            name: The name to translate
+            language: Target language for translation
+
+        Returns:
+            Translated name or None if translation fails
+        """
+        if not LLM.TRANSLATOR.API_KEY:
+            return None
+
+        try:
+            # Create LLM client
+            llm_client = Translator._create_llm_client()
+
+            prompt = LLMMessage(
+                role="user",
+                content=f"""Translate the name "{name}" to {language}.
+                If the name has a common {language} equivalent, use that.
+                Otherwise, use phonetic representation that sounds similar in {language}.
+                Just provide the translated name without explanation.
+                """,
+            )
+
+            # Simple invocation with no fallback
+            await translation_rate_limiter.acquire()
+            response = await llm_client.invoke(
+                messages=[prompt],
+                temperature=0.3,
+                max_tokens=50,
+            )
+
+            # Clean up the response
+            response = Translator._clean_translation(response)
+
+            # If we have a valid response, return it
+            if response:
+                await translation_cache.set(name, language, response)
+                return response
+
+        except Exception as e:
+            logger.error("Failed to translate name using LLM: %s", e)
+            # Rate limits and connection problems don't say anything about the
+            # name, so don't block retrying it
+            if is_transient_error(e):
+                return None
+
+        translation_cache.record_failure(name, language)
+        return None
+
+    @staticmethod
+    async def translate_names(names: List[str], language: str = None) -> List[str]:
+        """
+        Translates several names to the specified language in a single LLM request.
+        Each translation is stored in the cache, so later translate_name calls
+        for the same names are served without another request.
+
+        Args:
+            names: The names to translate
+            language: Target language for translation (optional, uses persistent setting if None)
+
+        Returns:
+            Translated names in order, or the original name where translation fails
+        """
+        # If no language specified, get from settings
+        if language is None:
+            language = await Translator.get_translation_language()
+
+        translated_names = list(names)
+
+        # Collect the distinct names that still need a translation
+        pending: Dict[str, List[int]] = {}
+        for index, name in enumerate(names):
+            if Translator.is_non_latin(name):
+                continue
+
+            cached_name = await translation_cache.get(name, language)
+            if cached_name is not None:
+                translated_names[index] = cached_name
+            elif not translation_cache.is_known_failure(name, language):
+                pending.setdefault(name, []).append(index)
+
+        if not pending or not LLM.TRANSLATOR.API_KEY:
+            return translated_names
+
+        unique_names = list(pending)
+        batch_translations = {}
+
+        try:
+            # Create LLM client
+            llm_client = Translator._create_llm_client()
+
+            prompt = LLMMessage(
+                role="user",
+                content=f"""Translate each of the following names to {language}.
+                If a name has a common {language} equivalent, use that.
+                Otherwise, use phonetic representation that sounds similar in {language}.
+                Respond with only a JSON array of the translated names in the same order, without explanation.
 
-                # Simple invocation with no fallback
-                response = await llm_client.invoke(
-                    messages=[prompt],
-                    temperature=0.3,
-                    max_tokens=50,
+                {json.dumps(unique_names, ensure_ascii=False)}
+                """,
+            )
+
+            await translation_rate_limiter.acquire()
+            response = await llm_client.invoke(
+                messages=[prompt],
+                temperature=0.3,
+                max_tokens=50 * len(unique_names),
+            )
+
+            # Extract the JSON array from the response
+            start, end = response.find("["), response.rfind("]")
+            results = json.loads(response[start : end + 1]) if start != -1 else None
+
+            if not isinstance(results, list) or len(results) != len(unique_names):
+                raise ValueError(
+                    "Response is not a JSON array matching the input names"
                 )
 
-                # Clean up the response
-                if response:
-                    # Remove any explanations, just get the name
-                    response = response.strip()
-                    # Remove any quotes that might be in the response
-                    response = response.replace('"', "").replace("'", "")
-                    # If response is too long, trim it
-                    if len(response) > 15:
-                        # Try to find where the actual name ends
-                        for char in [".", ",", "\n", " "]:
-                            if char in response:
-                                response = response.split(char)[0]
-
-                    # If we have a valid response, return it
-                    if response.strip():
-                        return response
-
-            except Exception as e:
-                logger.error(f"Failed to translate name using LLM: {str(e)}")
+            for name, result in zip(unique_names, results):
+                result = Translator._clean_translation(str(result))
+                if not result:
+                    translation_cache.record_failure(name, language)
+                    continue
 
-        # Return original name if translation fails
-        return name
+                batch_translations[name] = result
+                for index in pending[name]:
+                    translated_names[index] = result
+
+            # Store the whole batch at once so it costs a single cache save
+            await translation_cache.set_many(batch_translations, language)
+
+        except Exception as e:
+            logger.error("Failed to batch translate names using LLM: %s", e)
+            # Remember names the LLM couldn't translate, like translate_name
+            # does; transient errors don't say anything about the names
+            if not is_transient_error(e):
+                for name in unique_names:
+                    if name not in batch_translations:
+                        translation_cache.record_failure(name, language)
+
+        return translated_names
+
+    @staticmethod
+    def _create_llm_client() -> LLMClient:
+        """Create the LLM client used for translations."""
+        return LLMClient(
+            api_key=LLM.TRANSLATOR.API_KEY,
+            api_url=LLM.TRANSLATOR.API_URL,
+            model=LLM.TRANSLATOR.MODEL,
+            max_retries=3,
+            retry_base_delay=1.0,
+            retry_max_delay=8.0,
+            request_timeout=10.0,
+        )
+
+    @staticmethod
+    def _clean_translation(response: Optional[str]) -> str:
+        """
+        Cleans up an LLM translation so only the name remains.
+
+        Args:
+            response: Raw response from the LLM
+
+        Returns:
+            The cleaned name, or an empty string if nothing usable remains
+        """
+        if not response:
+            return ""
+
+        # Remove any explanations, just get the name
+        response = response.strip()
+        # Remove any quotes that might be in the response
+        response = QUOTES_PATTERN.sub("", response)
+        # If response is too long, trim it
+        if len(response) > 15:
+            # Keep everything before the first character that ends the name
+            response = NAME_END_PATTERN.split(response, maxsplit=1)[0]
+
+        return response.strip()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def is_non_latin(name: str) -> bool:
+        """
+        Checks whether a name already contains non-latin characters.
+
+        Args:
+            name: The name to check
+
+        Returns:
+            True if the name contains any non-ASCII character
+        """
+        return NON_LATIN_PATTERN.search(name) is not None
 
     @staticmethod
     async def set_translation_language(language: str) -> None:
@@ -95,7 +279,7 @@ class Translator:
         """
         settings = PersistentSettings()
         settings.set(Translator.SETTINGS_KEY, language)
-        logger.info(f"Default translation language set to: {language}")
+        logger.info("Default translation language set to: %s", language)
 
     @staticmethod
     async def get_translation_language() -> str: